@@ -6,24 +6,36 @@ A comprehensive utility for looking up EDI document types across various standar
 including ANSI X12, EDIFACT, TRADACOMS, VDA, and RosettaNet with rich metadata.
 """
 
-import argparse
-from typing import Dict, List, Optional
-from textwrap import fill
-from dataclasses import dataclass
-from enum import Enum, auto
-
-class Industry(Enum):
-    """Industry sectors for EDI documents"""
-    RETAIL = auto()
-    HEALTHCARE = auto()
-    MANUFACTURING = auto()
-    LOGISTICS = auto()
-    AUTOMOTIVE = auto()
-    TECHNOLOGY = auto()
-    FINANCE = auto()
-
-@dataclass
-class EdiStandard:
+import codecs
+import functools
+import sys
+from array import array
+from typing import Dict, Iterable, Iterator, List, NamedTuple, Optional, Tuple
+from enum import IntEnum, IntFlag
+
+class Industry(IntFlag):
+    """Industry sectors for EDI documents, combinable as a bitmask"""
+    RETAIL = 1
+    HEALTHCARE = 2
+    MANUFACTURING = 4
+    LOGISTICS = 8
+    AUTOMOTIVE = 16
+    TECHNOLOGY = 32
+    FINANCE = 64
+
+class Direction(IntEnum):
+    """Exchange direction of an EDI document"""
+    INBOUND = 0
+    OUTBOUND = 1
+    BOTH = 2
+
+DIRECTION_LABEL: Dict[Direction, str] = {
+    Direction.INBOUND: "Inbound",
+    Direction.OUTBOUND: "Outbound",
+    Direction.BOTH: "Both",
+}
+
+class EdiStandard(NamedTuple):
     """Metadata about an EDI standard"""
     name: str
     latest_version: str
@@ -31,18 +43,38 @@ class EdiStandard:
     governing_body: str
     year_established: int
 
-@dataclass
-class EdiDocument:
+class EdiDocument(NamedTuple):
     """Complete metadata about an EDI document type"""
     code: str
     name: str
     description: str
-    common_versions: List[str]
-    industries: List[Industry]
-    direction: str  # Inbound, Outbound, or Both
+    common_versions: Tuple[str, ...]
+    industries: Industry
+    direction: Direction
     transaction_flow: Optional[str] = None
 
+class DocumentDisplay(NamedTuple):
+    """Preformatted display fields for an EDI document"""
+    versions: str
+    industries: str
+    description: str
+
 # --- Constants and Data Structures ---
+# Shared version tuples, reused by every document of a standard
+X12_COMMON = ("4010", "5010", "6030")
+X12_FULL = ("4010", "4030", "5010", "6030")
+EDIFACT_COMMON = ("D96A", "D00B", "D22B")
+TRADACOMS_COMMON = ("v1", "v2", "v3")
+VDA_COMMON = ("4.3", "5.0", "6.0")
+ROSETTANET_COMMON = ("02.00.00",)
+
+# Transaction flows shared by several documents
+FLOW_SUPPLIER_BUYER = "Supplier → Buyer"
+FLOW_BUYER_SUPPLIER = "Buyer → Supplier"
+FLOW_SUPPLIER_RETAILER = "Supplier → Retailer"
+FLOW_SUPPLIER_OEM = "Supplier → OEM"
+FLOW_TRADING_PARTNERS = "Between trading partners"
+
 STANDARDS = {
     "ANSI_X12": EdiStandard(
         name="ANSI X12 (North American Standard)",
@@ -89,100 +121,100 @@ def get_edi_documents() -> Dict[str, Dict[str, EdiDocument]]:
                 code="204",
                 name="Motor Carrier Load Tender",
                 description="A transportation order for shipping goods between locations",
-                common_versions=["4010", "4030", "5010", "6030"],
-                industries=[Industry.LOGISTICS, Industry.MANUFACTURING],
-                direction="Outbound",
+                common_versions=X12_FULL,
+                industries=Industry.LOGISTICS | Industry.MANUFACTURING,
+                direction=Direction.OUTBOUND,
                 transaction_flow="Shipper → Carrier"
             ),
             "210": EdiDocument(
                 code="210",
                 name="Motor Carrier Freight Details and Invoice",
                 description="Detailed freight invoice from carrier to shipper",
-                common_versions=["4010", "5010", "6030"],
-                industries=[Industry.LOGISTICS],
-                direction="Inbound",
+                common_versions=X12_COMMON,
+                industries=Industry.LOGISTICS,
+                direction=Direction.INBOUND,
                 transaction_flow="Carrier → Shipper"
             ),
             "810": EdiDocument(
                 code="810",
                 name="Invoice",
                 description="Electronic invoice document for billing purposes",
-                common_versions=["4010", "5010", "6030"],
-                industries=[Industry.RETAIL, Industry.MANUFACTURING, Industry.HEALTHCARE],
-                direction="Both",
+                common_versions=X12_COMMON,
+                industries=Industry.RETAIL | Industry.MANUFACTURING | Industry.HEALTHCARE,
+                direction=Direction.BOTH,
                 transaction_flow="Supplier → Buyer or Service Provider → Client"
             ),
             "820": EdiDocument(
                 code="820",
                 name="Payment Order/Remittance Advice",
                 description="Electronic funds transfer payment information",
-                common_versions=["4010", "5010", "6030"],
-                industries=[Industry.FINANCE, Industry.RETAIL, Industry.MANUFACTURING],
-                direction="Outbound",
+                common_versions=X12_COMMON,
+                industries=Industry.FINANCE | Industry.RETAIL | Industry.MANUFACTURING,
+                direction=Direction.OUTBOUND,
                 transaction_flow="Payer → Payee"
             ),
             "834": EdiDocument(
                 code="834",
                 name="Benefit Enrollment and Maintenance",
                 description="Health insurance enrollment information exchange",
-                common_versions=["4010", "5010", "6030"],
-                industries=[Industry.HEALTHCARE],
-                direction="Both",
+                common_versions=X12_COMMON,
+                industries=Industry.HEALTHCARE,
+                direction=Direction.BOTH,
                 transaction_flow="Employer → Insurance Carrier or Government Agency → Provider"
             ),
             "850": EdiDocument(
                 code="850",
                 name="Purchase Order",
                 description="Buyer's formal request to purchase goods/services",
-                common_versions=["4010", "5010", "6030"],
-                industries=[Industry.RETAIL, Industry.MANUFACTURING, Industry.TECHNOLOGY],
-                direction="Outbound",
-                transaction_flow="Buyer → Supplier"
+                common_versions=X12_COMMON,
+                industries=Industry.RETAIL | Industry.MANUFACTURING | Industry.TECHNOLOGY,
+                direction=Direction.OUTBOUND,
+                transaction_flow=FLOW_BUYER_SUPPLIER
             ),
             "855": EdiDocument(
                 code="855",
                 name="Purchase Order Acknowledgment",
                 description="Supplier's response accepting or rejecting a PO",
-                common_versions=["4010", "5010", "6030"],
-                industries=[Industry.RETAIL, Industry.MANUFACTURING],
-                direction="Inbound",
-                transaction_flow="Supplier → Buyer"
+                common_versions=X12_COMMON,
+                industries=Industry.RETAIL | Industry.MANUFACTURING,
+                direction=Direction.INBOUND,
+                transaction_flow=FLOW_SUPPLIER_BUYER
             ),
             "856": EdiDocument(
                 code="856",
                 name="Advance Shipping Notice",
                 description="Detailed shipment information prior to delivery",
-                common_versions=["4010", "5010", "6030"],
-                industries=[Industry.RETAIL, Industry.MANUFACTURING, Industry.LOGISTICS],
-                direction="Outbound",
-                transaction_flow="Supplier → Buyer"
+                common_versions=X12_COMMON,
+                industries=Industry.RETAIL | Industry.MANUFACTURING | Industry.LOGISTICS,
+                direction=Direction.OUTBOUND,
+                transaction_flow=FLOW_SUPPLIER_BUYER
             ),
             "940": EdiDocument(
                 code="940",
                 name="Warehouse Shipping Order",
                 description="Instruction to warehouse to ship goods",
-                common_versions=["4010", "5010", "6030"],
-                industries=[Industry.LOGISTICS, Industry.RETAIL],
-                direction="Outbound",
+                common_versions=X12_COMMON,
+                industries=Industry.LOGISTICS | Industry.RETAIL,
+                direction=Direction.OUTBOUND,
                 transaction_flow="Retailer → Warehouse"
             ),
             "945": EdiDocument(
                 code="945",
                 name="Warehouse Shipping Advice",
                 description="Confirmation of warehouse shipment",
-                common_versions=["4010", "5010", "6030"],
-                industries=[Industry.LOGISTICS, Industry.RETAIL],
-                direction="Inbound",
+                common_versions=X12_COMMON,
+                industries=Industry.LOGISTICS | Industry.RETAIL,
+                direction=Direction.INBOUND,
                 transaction_flow="Warehouse → Retailer"
             ),
             "997": EdiDocument(
                 code="997",
                 name="Functional Acknowledgment",
                 description="Technical confirmation of received EDI transmission",
-                common_versions=["4010", "5010", "6030"],
-                industries=[Industry.RETAIL, Industry.MANUFACTURING, Industry.HEALTHCARE],
-                direction="Both",
-                transaction_flow="Between trading partners"
+                common_versions=X12_COMMON,
+                industries=Industry.RETAIL | Industry.MANUFACTURING | Industry.HEALTHCARE,
+                direction=Direction.BOTH,
+                transaction_flow=FLOW_TRADING_PARTNERS
             )
         },
         STANDARDS["EDIFACT"].name: {
@@ -190,64 +222,64 @@ def get_edi_documents() -> Dict[str, Dict[str, EdiDocument]]:
                 code="DESADV",
                 name="Dispatch Advice",
                 description="Notification of goods dispatched (similar to X12 856)",
-                common_versions=["D96A", "D00B", "D22B"],
-                industries=[Industry.LOGISTICS, Industry.MANUFACTURING],
-                direction="Outbound",
-                transaction_flow="Supplier → Buyer"
+                common_versions=EDIFACT_COMMON,
+                industries=Industry.LOGISTICS | Industry.MANUFACTURING,
+                direction=Direction.OUTBOUND,
+                transaction_flow=FLOW_SUPPLIER_BUYER
             ),
             "IFCSUM": EdiDocument(
                 code="IFCSUM",
                 name="International Forwarding and Consolidation Summary",
                 description="Shipping consolidation details for international logistics",
-                common_versions=["D96A", "D00B", "D22B"],
-                industries=[Industry.LOGISTICS],
-                direction="Both",
+                common_versions=EDIFACT_COMMON,
+                industries=Industry.LOGISTICS,
+                direction=Direction.BOTH,
                 transaction_flow="Between logistics providers"
             ),
             "INVOIC": EdiDocument(
                 code="INVOIC",
                 name="Invoice",
                 description="International invoice document for billing",
-                common_versions=["D96A", "D00B", "D22B"],
-                industries=[Industry.RETAIL, Industry.MANUFACTURING],
-                direction="Outbound",
-                transaction_flow="Supplier → Buyer"
+                common_versions=EDIFACT_COMMON,
+                industries=Industry.RETAIL | Industry.MANUFACTURING,
+                direction=Direction.OUTBOUND,
+                transaction_flow=FLOW_SUPPLIER_BUYER
             ),
             "ORDERS": EdiDocument(
                 code="ORDERS",
                 name="Purchase Order",
                 description="International purchase order document",
-                common_versions=["D96A", "D00B", "D22B"],
-                industries=[Industry.RETAIL, Industry.MANUFACTURING],
-                direction="Outbound",
-                transaction_flow="Buyer → Supplier"
+                common_versions=EDIFACT_COMMON,
+                industries=Industry.RETAIL | Industry.MANUFACTURING,
+                direction=Direction.OUTBOUND,
+                transaction_flow=FLOW_BUYER_SUPPLIER
             ),
             "ORDRSP": EdiDocument(
                 code="ORDRSP",
                 name="Order Response",
                 description="Response to a purchase order (acceptance/rejection)",
-                common_versions=["D96A", "D00B", "D22B"],
-                industries=[Industry.RETAIL, Industry.MANUFACTURING],
-                direction="Inbound",
-                transaction_flow="Supplier → Buyer"
+                common_versions=EDIFACT_COMMON,
+                industries=Industry.RETAIL | Industry.MANUFACTURING,
+                direction=Direction.INBOUND,
+                transaction_flow=FLOW_SUPPLIER_BUYER
             ),
             "PRICAT": EdiDocument(
                 code="PRICAT",
                 name="Price/Sales Catalog",
                 description="Product catalog with pricing information",
-                common_versions=["D96A", "D00B", "D22B"],
-                industries=[Industry.RETAIL, Industry.MANUFACTURING],
-                direction="Outbound",
-                transaction_flow="Supplier → Buyer"
+                common_versions=EDIFACT_COMMON,
+                industries=Industry.RETAIL | Industry.MANUFACTURING,
+                direction=Direction.OUTBOUND,
+                transaction_flow=FLOW_SUPPLIER_BUYER
             ),
             "RECADV": EdiDocument(
                 code="RECADV",
                 name="Receiving Advice",
                 description="Notification of goods received (similar to X12 861)",
-                common_versions=["D96A", "D00B", "D22B"],
-                industries=[Industry.RETAIL, Industry.MANUFACTURING],
-                direction="Inbound",
-                transaction_flow="Buyer → Supplier"
+                common_versions=EDIFACT_COMMON,
+                industries=Industry.RETAIL | Industry.MANUFACTURING,
+                direction=Direction.INBOUND,
+                transaction_flow=FLOW_BUYER_SUPPLIER
             )
         },
         STANDARDS["TRADACOMS"].name: {
@@ -255,36 +287,36 @@ def get_edi_documents() -> Dict[str, Dict[str, EdiDocument]]:
                 code="DELHDR",
                 name="Delivery Header",
                 description="Delivery instructions for UK retail orders",
-                common_versions=["v1", "v2", "v3"],
-                industries=[Industry.RETAIL],
-                direction="Outbound",
-                transaction_flow="Supplier → Retailer"
+                common_versions=TRADACOMS_COMMON,
+                industries=Industry.RETAIL,
+                direction=Direction.OUTBOUND,
+                transaction_flow=FLOW_SUPPLIER_RETAILER
             ),
             "INVFIL": EdiDocument(
                 code="INVFIL",
                 name="Invoice File",
                 description="UK retail-specific invoice format",
-                common_versions=["v1", "v2", "v3"],
-                industries=[Industry.RETAIL],
-                direction="Outbound",
-                transaction_flow="Supplier → Retailer"
+                common_versions=TRADACOMS_COMMON,
+                industries=Industry.RETAIL,
+                direction=Direction.OUTBOUND,
+                transaction_flow=FLOW_SUPPLIER_RETAILER
             ),
             "ORDHDR": EdiDocument(
                 code="ORDHDR",
                 name="Order Header",
                 description="UK retail purchase order document",
-                common_versions=["v1", "v2", "v3"],
-                industries=[Industry.RETAIL],
-                direction="Outbound",
+                common_versions=TRADACOMS_COMMON,
+                industries=Industry.RETAIL,
+                direction=Direction.OUTBOUND,
                 transaction_flow="Retailer → Supplier"
             ),
             "ORDCHG": EdiDocument(
                 code="ORDCHG",
                 name="Order Change",
                 description="Modification to an existing purchase order",
-                common_versions=["v1", "v2", "v3"],
-                industries=[Industry.RETAIL],
-                direction="Both",
+                common_versions=TRADACOMS_COMMON,
+                industries=Industry.RETAIL,
+                direction=Direction.BOTH,
                 transaction_flow="Between retailer and supplier"
             )
         },
@@ -293,28 +325,28 @@ def get_edi_documents() -> Dict[str, Dict[str, EdiDocument]]:
                 code="4905",
                 name="Delivery Schedule",
                 description="Just-in-time delivery schedule for automotive manufacturing",
-                common_versions=["4.3", "5.0", "6.0"],
-                industries=[Industry.AUTOMOTIVE],
-                direction="Outbound",
+                common_versions=VDA_COMMON,
+                industries=Industry.AUTOMOTIVE,
+                direction=Direction.OUTBOUND,
                 transaction_flow="OEM → Supplier"
             ),
             "4913": EdiDocument(
                 code="4913",
                 name="Invoice",
                 description="Automotive industry-specific invoice format",
-                common_versions=["4.3", "5.0", "6.0"],
-                industries=[Industry.AUTOMOTIVE],
-                direction="Outbound",
-                transaction_flow="Supplier → OEM"
+                common_versions=VDA_COMMON,
+                industries=Industry.AUTOMOTIVE,
+                direction=Direction.OUTBOUND,
+                transaction_flow=FLOW_SUPPLIER_OEM
             ),
             "4981": EdiDocument(
                 code="4981",
                 name="Shipping Notification",
                 description="Advanced shipping notice for automotive parts",
-                common_versions=["4.3", "5.0", "6.0"],
-                industries=[Industry.AUTOMOTIVE],
-                direction="Outbound",
-                transaction_flow="Supplier → OEM"
+                common_versions=VDA_COMMON,
+                industries=Industry.AUTOMOTIVE,
+                direction=Direction.OUTBOUND,
+                transaction_flow=FLOW_SUPPLIER_OEM
             )
         },
         STANDARDS["ROSETTANET"].name: {
@@ -322,41 +354,114 @@ def get_edi_documents() -> Dict[str, Dict[str, EdiDocument]]:
                 code="3A4",
                 name="Purchase Order",
                 description="High-tech industry purchase order",
-                common_versions=["02.00.00"],
-                industries=[Industry.TECHNOLOGY],
-                direction="Outbound",
-                transaction_flow="Buyer → Supplier"
+                common_versions=ROSETTANET_COMMON,
+                industries=Industry.TECHNOLOGY,
+                direction=Direction.OUTBOUND,
+                transaction_flow=FLOW_BUYER_SUPPLIER
             ),
             "3A8": EdiDocument(
                 code="3A8",
                 name="Purchase Order Change",
                 description="Modification to a technology purchase order",
-                common_versions=["02.00.00"],
-                industries=[Industry.TECHNOLOGY],
-                direction="Both",
-                transaction_flow="Between trading partners"
+                common_versions=ROSETTANET_COMMON,
+                industries=Industry.TECHNOLOGY,
+                direction=Direction.BOTH,
+                transaction_flow=FLOW_TRADING_PARTNERS
             ),
             "3B2": EdiDocument(
                 code="3B2",
                 name="Shipping Notification",
                 description="Advanced shipping notice for technology products",
-                common_versions=["02.00.00"],
-                industries=[Industry.TECHNOLOGY],
-                direction="Outbound",
-                transaction_flow="Supplier → Buyer"
+                common_versions=ROSETTANET_COMMON,
+                industries=Industry.TECHNOLOGY,
+                direction=Direction.OUTBOUND,
+                transaction_flow=FLOW_SUPPLIER_BUYER
             ),
             "4B2": EdiDocument(
                 code="4B2",
                 name="Advance Shipment Notification",
                 description="Detailed shipment information for technology supply chain",
-                common_versions=["02.00.00"],
-                industries=[Industry.TECHNOLOGY],
-                direction="Outbound",
-                transaction_flow="Supplier → Buyer"
+                common_versions=ROSETTANET_COMMON,
+                industries=Industry.TECHNOLOGY,
+                direction=Direction.OUTBOUND,
+                transaction_flow=FLOW_SUPPLIER_BUYER
             )
         }
     }
 
+def _build_code_index(codes: List[str]) -> Dict[str, List[int]]:
+    """Maps every substring of every document code to the matching rows"""
+    index: Dict[str, List[int]] = {}
+    for row, doc_code in enumerate(codes):
+        substrings = {doc_code[i:j] for i in range(len(doc_code))
+                      for j in range(i + 1, len(doc_code) + 1)}
+        for sub in substrings:
+            index.setdefault(sub, []).append(row)
+    return index
+
+def _code_sort_key(code: str) -> Tuple[int, int, str]:
+    """Sorts numeric codes numerically ahead of alphanumeric codes"""
+    return (0, int(code), code) if code.isdigit() else (1, 0, code)
+
+EDI_DOCUMENTS = get_edi_documents()
+ALL_DOCUMENTS = [(standard, doc_code, doc)
+                 for standard, docs in EDI_DOCUMENTS.items()
+                 for doc_code, doc in docs.items()]
+
+# Columnar view of ALL_DOCUMENTS: row i of each column describes one document
+STANDARD_NAMES = list(EDI_DOCUMENTS)
+DOC_CODES: List[str] = [doc_code for _, doc_code, _ in ALL_DOCUMENTS]
+DOC_RECORDS: List[EdiDocument] = [doc for _, _, doc in ALL_DOCUMENTS]
+DOC_STANDARD_IDX = array('B', (STANDARD_NAMES.index(standard)
+                                for standard, _, _ in ALL_DOCUMENTS))
+INDUSTRIES_MASK: List[int] = [int(doc.industries) for doc in DOC_RECORDS]
+STANDARD_ROWS: Dict[str, List[int]] = {
+    standard: sorted((row for row, idx in enumerate(DOC_STANDARD_IDX) if idx == std_idx),
+                     key=lambda row: _code_sort_key(DOC_CODES[row]))
+    for std_idx, standard in enumerate(STANDARD_NAMES)
+}
+CODES_UPPER: List[str] = [doc_code.upper() for doc_code in DOC_CODES]
+CODE_INDEX = _build_code_index(CODES_UPPER)
+
+INDUSTRY_NAME: Dict[Industry, str] = {ind: ind.name for ind in Industry}
+IND_NAME_LOWER: Dict[Industry, str] = {ind: ind.name.casefold() for ind in Industry}
+INDUSTRY_BY_NAME = {name: ind for ind, name in IND_NAME_LOWER.items()}
+STANDARD_KEYS_LOWER: Dict[str, str] = {
+    standard: standard.casefold() for standard in EDI_DOCUMENTS
+}
+
+def _build_standard_alias_index(folded_names: Dict[str, str]) -> Dict[str, List[str]]:
+    """Maps each name token, and each token prefix of 2+ characters, to the
+    standards whose folded name contains it"""
+    aliases = set()
+    for folded in folded_names.values():
+        for token in "".join(c if c.isalnum() else " " for c in folded).split():
+            aliases.update(token[:end] for end in range(2, len(token) + 1))
+    return {
+        alias: [std for std, folded in folded_names.items() if alias in folded]
+        for alias in aliases
+    }
+
+STANDARD_ALIAS_INDEX = _build_standard_alias_index(STANDARD_KEYS_LOWER)
+
+@functools.lru_cache(maxsize=None)
+def _industry_label(industries: Industry) -> str:
+    """Joins the member names of an industry flag, once per distinct flag"""
+    return ', '.join(name for ind, name in INDUSTRY_NAME.items() if industries & ind)
+
+@functools.lru_cache(maxsize=1)
+def _display_cache() -> Dict[Tuple[str, str], DocumentDisplay]:
+    """Builds the (standard, code) -> DocumentDisplay table on first use"""
+    from textwrap import fill
+    return {
+        (standard, doc_code): DocumentDisplay(
+            versions=', '.join(doc.common_versions),
+            industries=_industry_label(doc.industries),
+            description=fill(doc.description, width=70, subsequent_indent='    ')
+        )
+        for standard, doc_code, doc in ALL_DOCUMENTS
+    }
+
 # --- Core Functions ---
 def list_standards(detailed: bool = False) -> None:
     """Display all supported EDI standards with optional details"""
@@ -369,65 +474,114 @@ def list_standards(detailed: bool = False) -> None:
             print(f"  - Governing Body: {std.governing_body}")
             print(f"  - Established: {std.year_established}\n")
 
+def _format_doc(standard: str, code: str, doc: EdiDocument) -> str:
+    """Renders one document entry as a single multi-line string"""
+    display = _display_cache()[standard, code]
+    lines = [f"• {code}: {doc.name}", f"  Direction: {DIRECTION_LABEL[doc.direction]}"]
+    if doc.transaction_flow:
+        lines.append(f"  Flow: {doc.transaction_flow}")
+    lines.append(f"  Versions: {display.versions}")
+    lines.append(f"  Industries: {display.industries}")
+    lines.append(f"  Description: {display.description}\n\n")
+    return "\n".join(lines)
+
+def _write_chunks(chunks: Iterable[str]) -> None:
+    """Writes output chunks to stdout, encoding them in one pass when possible"""
+    stream = sys.stdout
+    buffer = getattr(stream, "buffer", None)
+    encoding = getattr(stream, "encoding", None)
+    if buffer is None or not encoding or codecs.lookup(encoding).name != "utf-8":
+        stream.writelines(chunks)
+        return
+    # Flush pending text first so bytes land after anything already printed
+    stream.flush()
+    buffer.write("".join(chunks).encode("utf-8", stream.errors or "strict"))
+
+@functools.lru_cache(maxsize=None)
+def _filter_by_industry_mask(standard: str, want: int) -> Tuple[int, ...]:
+    """Returns the standard's rows whose industry mask shares a bit with want"""
+    masks = INDUSTRIES_MASK
+    return tuple(row for row in STANDARD_ROWS[standard] if masks[row] & want)
+
+def _iter_doc_lines(standards: Iterable[str],
+                    industry_mask: Optional[int] = None) -> Iterator[str]:
+    """Yields the document listing for the given standards as output chunks"""
+    yield "\nEDI Document Reference:\n\n"
+    for standard in standards:
+        yield f"== {standard} ==\n"
+        yield f"{'-' * (len(standard) + 4)}\n\n"
+        # Apply industry filter if specified
+        if industry_mask is None:
+            rows: Iterable[int] = STANDARD_ROWS[standard]
+        else:
+            rows = _filter_by_industry_mask(standard, industry_mask)
+        for row in rows:
+            yield _format_doc(standard, DOC_CODES[row], DOC_RECORDS[row])
+
 def list_edi_documents(filter_standard: Optional[str] = None, 
                       filter_industry: Optional[str] = None) -> None:
     """List all EDI documents with filtering options"""
-    edi_docs = get_edi_documents()
+    fs = filter_standard.casefold() if filter_standard else None
+    fi = filter_industry.casefold() if filter_industry else None
     
-    if filter_standard:
-        edi_docs = {k: v for k, v in edi_docs.items() 
-                   if filter_standard.lower() in k.lower()}
-        if not edi_docs:
+    standards: Iterable[str] = EDI_DOCUMENTS
+    if fs:
+        standards = (STANDARD_ALIAS_INDEX.get(fs)
+                     or [std for std, folded in STANDARD_KEYS_LOWER.items() if fs in folded])
+        if not standards:
             print(f"\nNo standards found matching '{filter_standard}'")
             return
 
-    print("\nEDI Document Reference:\n")
-    for standard, docs in edi_docs.items():
-        print(f"== {standard} ==")
-        print(f"{'-' * (len(standard) + 4)}\n")
-        
-        for code in sorted(docs.keys(), key=lambda x: (int(x) if x.isdigit() else x)):
-            doc = docs[code]
-            
-            # Apply industry filter if specified
-            if filter_industry:
-                if not any(filter_industry.lower() in ind.name.lower() 
-                         for ind in doc.industries):
-                    continue
-            
-            print(f"• {code}: {doc.name}")
-            print(f"  Direction: {doc.direction}")
-            if doc.transaction_flow:
-                print(f"  Flow: {doc.transaction_flow}")
-            print(f"  Versions: {', '.join(doc.common_versions)}")
-            print(f"  Industries: {', '.join(ind.name for ind in doc.industries)}")
-            print(f"  Description: {fill(doc.description, width=70, subsequent_indent='    ')}\n")
+    industry_mask = None
+    if fi:
+        industry = INDUSTRY_BY_NAME.get(fi)
+        if industry is not None:
+            industries = [industry]
+        else:
+            industries = [ind for ind, name in IND_NAME_LOWER.items() if fi in name]
+        industry_mask = Industry(0)
+        for ind in industries:
+            industry_mask |= ind
+
+    _write_chunks(_iter_doc_lines(standards, industry_mask))
 
 def search_edi_code(code: str, show_all: bool = False) -> None:
     """Search for EDI documents with flexible matching"""
-    edi_docs = get_edi_documents()
     code = code.upper()
-    found = False
+    if show_all or not code:
+        rows: Iterable[int] = range(len(DOC_CODES))
+    else:
+        rows = CODE_INDEX.get(code, [])
     
     print(f"\nSearch Results for '{code}':\n")
-    for standard, docs in edi_docs.items():
-        for doc_code, doc in docs.items():
-            if code in doc_code or show_all:
-                print(f"== {standard} ==")
-                print(f"• {doc_code}: {doc.name}")
-                print(f"  Direction: {doc.direction}")
-                if doc.transaction_flow:
-                    print(f"  Flow: {doc.transaction_flow}")
-                print(f"  Versions: {', '.join(doc.common_versions)}")
-                print(f"  Industries: {', '.join(ind.name for ind in doc.industries)}")
-                print(f"  Description: {fill(doc.description, width=70, subsequent_indent='    ')}\n")
-                found = True
+    chunks = []
+    for row in rows:
+        standard = STANDARD_NAMES[DOC_STANDARD_IDX[row]]
+        chunks.append(f"== {standard} ==\n")
+        chunks.append(_format_doc(standard, DOC_CODES[row], DOC_RECORDS[row]))
+    _write_chunks(chunks)
     
-    if not found:
+    if not chunks:
         print(f"No EDI documents found matching '{code}'")
 
 # --- Command Line Interface ---
+def _run_fast_path(argv: List[str]) -> bool:
+    """Handles the most common invocations without building the full parser"""
+    if not argv:
+        list_edi_documents()
+    elif argv == ["-l"]:
+        list_standards()
+    elif len(argv) == 2 and argv[0] == "-c" and argv[1] and not argv[1].startswith("-"):
+        search_edi_code(argv[1])
+    else:
+        return False
+    return True
+
 def main():
+    if _run_fast_path(sys.argv[1:]):
+        return
+    
+    import argparse
     parser = argparse.ArgumentParser(
         description="Enhanced EDI Document Reference Tool",
         formatter_class=argparse.RawDescriptionHelpFormatter,